@@ -1,28 +1,55 @@
+import logging
 import os
+import random
 import time
 from data_sources import WeatherDataSources
-from logz_api import LogzAPI
+from logz_api import LogzClient
 import signal
 import sys
+import threading
 
-import dotenv
+import config
+from http_session import is_transient
 
-dotenv.load_dotenv()
+logger = logging.getLogger(__name__)
 
 
 class WeatherApp:
+
+    # API keys each data source needs in order to be polled
+    SOURCE_SETTINGS = {1: "WEATHER_API_KEY", 2: "OPENWEATHERMAP_API_KEY"}
+
+    # upper bound in seconds for the delay between failed cycles
+    MAX_BACKOFF = 300
+
     def __init__(self, cities, sources):
         self.cities = cities
         self.sources = sources
-        self.shutdown_requested = False
+        self.check_config()
+        self._stop = threading.Event()
+        self._consec_failures = 0
+        self.logz = LogzClient()
 
         self.setup_signal_handlers()
         self.lifecycle()
 
+    def check_config(self):
+        """Fail at startup instead of on the first request if settings are missing"""
+        config.require(
+            "POLLING_INTERVAL",
+            "LOGZ_TOKEN",
+            "LOGZ_HOST",
+            *(
+                self.SOURCE_SETTINGS[s]
+                for s in self.sources
+                if s in self.SOURCE_SETTINGS
+            ),
+        )
+
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
-        print(f"\nReceived signal {signum}. Initiating graceful shutdown...")
-        self.shutdown_requested = True
+        logger.info("Received signal %s. Initiating graceful shutdown...", signum)
+        self._stop.set()
 
     def setup_signal_handlers(self):
         """Set up signal handlers for graceful shutdown"""
@@ -31,42 +58,85 @@ class WeatherApp:
 
     def _interruptible_sleep(self, duration):
         """Sleep that can be interrupted by shutdown signal"""
-        for _ in range(duration):
-            if self.shutdown_requested:
-                break
-            time.sleep(1)
+        if duration > 0:
+            self._stop.wait(duration)
+
+    def _backoff_delay(self, interval):
+        """Exponential backoff with jitter for consecutive failed cycles"""
+        delay = min(self.MAX_BACKOFF, interval * 2**self._consec_failures)
+        return delay + random.uniform(0, interval)
+
+    def _next_delay(self, interval, elapsed, failed):
+        """Seconds to wait before the next cycle, backing off while cycles fail"""
+        if failed:
+            self._consec_failures += 1
+            return self._backoff_delay(interval)
+
+        self._consec_failures = 0
+        return interval - elapsed
+
+    @staticmethod
+    def _cycle_failed(polled_data: dict):
+        """A cycle failed if any provider hit a transient error"""
+        # permanent errors (unknown city, revoked key) won't recover by polling
+        # less often, and backing off would slow down the healthy providers too
+        return any(
+            isinstance(result, dict) and result.get("transient")
+            for result in polled_data.values()
+        )
 
     @staticmethod
     def get_weather(cities: [str], sources: [int]):
         return WeatherDataSources.get_weather(cities, sources)
 
     def lifecycle(self):
-        print("started Weather App lifecycle")
+        logger.info("started Weather App lifecycle")
         interval = int(os.environ.get("POLLING_INTERVAL"))
 
-        while not self.shutdown_requested:
-
-            try:
-
-                polled_data = WeatherDataSources.get_weather(self.cities, self.sources)
-                print("Finished Polling Data:")
-                print(polled_data)
-
-                LogzAPI.post_log(
-                    {"message": "WeatherApp | data poll cycle", "data": polled_data}
-                )
-
-                self._interruptible_sleep(interval)
-
-            except Exception as e:
-                print(f"Error in lifecycle: {e}")
-                if self.shutdown_requested:
-                    break
-
-                # Continue with next cycle if not shutting down
-                self._interruptible_sleep(interval)
-
-        print("Weather App lifecycle completed gracefully")
+        try:
+            while not self._stop.is_set():
+                # sleep only for what is left of the interval, so fetch time overlaps the wait
+                cycle_start = time.monotonic()
+
+                try:
+
+                    polled_data = WeatherDataSources.get_weather(
+                        self.cities, self.sources
+                    )
+                    # lazy %s formatting - the dict is only rendered when DEBUG is enabled
+                    logger.info("Finished Polling Data")
+                    logger.debug("poll cycle %s", polled_data)
+
+                    self.logz.post_log(
+                        {"message": "WeatherApp | data poll cycle", "data": polled_data}
+                    )
+
+                    self._interruptible_sleep(
+                        self._next_delay(
+                            interval,
+                            time.monotonic() - cycle_start,
+                            self._cycle_failed(polled_data),
+                        )
+                    )
+
+                except Exception as e:
+                    logger.error("Error in lifecycle: %s", e)
+                    if self._stop.is_set():
+                        break
+
+                    # Continue with next cycle if not shutting down, backing off
+                    # further on every consecutive transient failure
+                    self._interruptible_sleep(
+                        self._next_delay(
+                            interval, time.monotonic() - cycle_start, is_transient(e)
+                        )
+                    )
+        finally:
+            # log posts never block the polling loop - make sure queued ones are sent
+            logger.info("Flushing pending logs...")
+            self.logz.close()
+
+        logger.info("Weather App lifecycle completed gracefully")
 
 
 # WEATHER_APP = WeatherApp()
@@ -0,0 +1,28 @@
+import os
+
+import dotenv
+
+# the only place .env is read - every other module takes its settings from here
+dotenv.load_dotenv()
+
+
+# seconds a provider response is served from cache before it is fetched again
+CACHE_TTL = int(os.getenv("WEATHER_CACHE_TTL", 300))
+CACHE_MAXSIZE = 256
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+# provider credentials - resolved once at import instead of on every request
+WEATHER_API_KEY = os.getenv("WEATHER_API_KEY")
+OPENWEATHERMAP_API_KEY = os.getenv("OPENWEATHERMAP_API_KEY")
+LOGZ_TOKEN = os.getenv("LOGZ_TOKEN")
+LOGZ_HOST = os.getenv("LOGZ_HOST")
+
+
+def require(*names: str):
+    """Fail fast if any of the given environment variables is missing"""
+    missing = [name for name in names if not os.getenv(name)]
+    if missing:
+        raise RuntimeError(
+            f"Missing required environment variables: {', '.join(missing)}"
+        )
@@ -1,8 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from http_session import is_transient
 from weather_api import WeatherAPI
 from weathermap_api import WeathermapAPI
 from weather_data_api import WeatherDataAPI
 
-
 """
 # main data source handler class
     sources are refered to as numbers:
@@ -12,6 +15,16 @@ from weather_data_api import WeatherDataAPI
 """
 
 
+# provider callables resolved once at import, keyed by source number
+_PROVIDERS: dict[int, Callable] = {
+    1: WeatherAPI.get_weather,
+    2: WeathermapAPI.get_weather,
+    3: WeatherDataAPI.get_weather,
+}
+
+VALID_SOURCES = frozenset(_PROVIDERS)
+
+
 class WeatherDataSources:
 
     @staticmethod
@@ -23,21 +36,28 @@ class WeatherDataSources:
         if len(sources) == 0:
             return {"warning": "no data sources were provided"}
 
-        for source in sources:
-            if source != 1 and source != 2 and source != 3:
-                return {"warning": "no valid data sources were provided"}
+        # dict.fromkeys drops repeated sources while keeping the requested order
+        requested = list(dict.fromkeys(sources))
+        invalid = [source for source in requested if source not in VALID_SOURCES]
+        if invalid:
+            return {"warning": f"invalid data sources were provided: {invalid}"}
 
-        result = {}
+        # query all requested providers simultaneously
+        with ThreadPoolExecutor(max_workers=len(requested)) as executor:
+            futures = {
+                source: executor.submit(_PROVIDERS[source], cities)
+                for source in requested
+            }
 
-        for source in sources:
-            if source == 1:
-                source_1_result = WeatherAPI.get_weather(cities)
-                result["source_1_result"] = source_1_result
-            elif source == 2:
-                source_2_result = WeathermapAPI.get_weather(cities)
-                result["source_2_result"] = source_2_result
-            elif source == 3:
-                source_3_result = WeatherDataAPI.get_weather(cities)
-                result["source_3_result"] = source_3_result
+        # a failing provider is reported in its own slot instead of discarding the others
+        result = {}
+        for source, future in futures.items():
+            try:
+                result[f"source_{source}_result"] = future.result()
+            except Exception as e:
+                result[f"source_{source}_result"] = {
+                    "error": str(e),
+                    "transient": is_transient(e),
+                }
 
         return result
@@ -0,0 +1,125 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus
+
+import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache, cached
+from urllib3.util.retry import Retry
+
+from config import CACHE_MAXSIZE, CACHE_TTL
+from single_flight import single_flight
+
+"""
+# shared HTTP session for all outbound API calls
+    keeps connections alive between calls, so polling the same hosts
+    does not pay for a new TCP/TLS handshake on every request.
+    responses are persisted to a local SQLite cache, so restarting the app
+    does not re-fetch everything, and upstream Cache-Control / ETag headers
+    are honored, so expired responses are revalidated with conditional requests
+"""
+
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 32
+
+# upper bound for concurrent per-city requests issued by a single provider
+MAX_WORKERS = 16
+
+# provider API keys are sent as query parameters - keep them out of the cache file
+IGNORED_PARAMETERS = [*requests_cache.DEFAULT_IGNORED_PARAMS, "key", "appid"]
+
+# transient upstream failures and rate limiting are retried with exponential backoff.
+# POST is included so Logz bulk uploads are retried too
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+_retry = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=RETRY_STATUSES,
+    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+)
+
+
+def create_session(cache_name: str = "weather_cache", **options):
+    """Build a pooled, retrying session that caches GET responses"""
+    # expired responses stay cached together with their ETag / Last-Modified
+    # validators, so refreshing one is a conditional request - an unchanged
+    # response comes back as a bodyless 304 and the cached body is reused
+    session = requests_cache.CachedSession(
+        cache_name,
+        **{
+            "expire_after": CACHE_TTL,
+            "cache_control": True,
+            "ignored_parameters": IGNORED_PARAMETERS,
+            **options,
+        },
+    )
+
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=_retry
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the shared session, creating it (and its cache file) on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def city_key(city: str) -> str:
+    """Normalize a city name for lookups - collapse whitespace and ignore case"""
+    return " ".join(city.split()).casefold()
+
+
+def city_fetcher(url_template: str, transform):
+    """Build a provider's per-city fetch, cached for CACHE_TTL and single-flight"""
+    cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+
+    # cities are cached by city_key, but the provider gets the spelling as given
+    @single_flight(key=city_key)
+    @cached(cache, key=city_key, lock=threading.Lock())
+    def get_one(city: str):
+        response = get_session().get(url_template.format(city=quote_plus(city)))
+        # error bodies (unknown city, bad key) surface as HTTPError with their status
+        response.raise_for_status()
+        return transform(response.json())
+
+    return get_one
+
+
+def fetch_all(get_one, cities: [str]):
+    """Fetch every city concurrently, keeping the requested order"""
+    # total latency is ~1 round trip instead of N, and cities still cached
+    # from a previous poll skip the request entirely
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_WORKERS, len(cities)))
+    ) as executor:
+        return list(executor.map(get_one, cities))
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether a failed request may succeed if retried later"""
+    # an unknown city or a revoked key fails the same way on every poll
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in RETRY_STATUSES
+
+    return isinstance(
+        error,
+        (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.RetryError,
+            requests.exceptions.ChunkedEncodingError,
+        ),
+    )
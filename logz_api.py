@@ -1,35 +1,114 @@
-import requests
-import os
-import json
-import dotenv
+import queue
+import threading
+import time
+import logging
+import orjson
 
-dotenv.load_dotenv()
+from config import LOGZ_HOST, LOGZ_TOKEN
+from http_session import get_session
 
+logger = logging.getLogger(__name__)
 
-class LogzAPI:
 
-    @staticmethod
-    def get_token():
-        return os.environ.get("LOGZ_TOKEN")
+class LogzAPI:
 
-    @staticmethod
-    def get_host():
-        return os.environ.get("LOGZ_HOST")
+    URL = f"{LOGZ_HOST}?token={LOGZ_TOKEN}&type=http-bulk"
 
     @staticmethod
-    def post_log(data: dict):
-        log = json.dumps(data)
-        url = f"{LogzAPI.get_host()}?token={LogzAPI.get_token()}&type=http-bulk"
-        response = requests.post(
-            url,
+    def post_logs(entries: [dict]):
+        # http-bulk expects newline delimited JSON - one document per log entry.
+        # orjson serializes straight to bytes, so there is no str -> bytes encode step
+        log = b"\n".join(orjson.dumps(data) for data in entries)
+        response = get_session().post(
+            LogzAPI.URL,
             data=log,
             headers={
                 "User-Agent": "logzio-json-logs",
                 "Content-Type": "application/json",
             },
         )
+        # a bad token or rejected batch must reach the caller, not be dropped silently
+        response.raise_for_status()
         return response
 
+    @staticmethod
+    def post_log(data: dict):
+        return LogzAPI.post_logs([data])
+
+
+"""
+# buffered Logz client
+    log entries are queued without blocking the caller, and a background
+    thread ships them in batches - whenever BATCH_SIZE entries are pending,
+    or every FLUSH_INTERVAL seconds. close() flushes whatever is left.
+    at most MAX_PENDING entries are buffered - if Logz is slow or down, new
+    entries are dropped rather than growing memory or blocking the caller
+"""
+
+
+class LogzClient:
+
+    BATCH_SIZE = 100
+    FLUSH_INTERVAL = 5
+    MAX_PENDING = 1000
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        batch_size=BATCH_SIZE,
+        flush_interval=FLUSH_INTERVAL,
+        max_pending=MAX_PENDING,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_pending)
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def post_log(self, data: dict):
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            logger.warning("Logz queue is full, dropping log entry")
+
+    def close(self):
+        """Flush pending log entries and stop the background thread"""
+        self._queue.put(LogzClient._STOP)
+        self._thread.join()
+
+    def _flush(self, batch: [dict]):
+        if not batch:
+            return
+
+        try:
+            LogzAPI.post_logs(batch)
+        except Exception as e:
+            logger.error("Error posting logs to Logz: %s", e)
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while True:
+            try:
+                entry = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                entry = None
+
+            if entry is LogzClient._STOP:
+                self._flush(batch)
+                return
+
+            if entry is not None:
+                batch.append(entry)
+
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._flush(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+
 
 # res = LogzAPI.post_log('{"message": "---HELLO WORLD 2---"}')
 # print(res.text)
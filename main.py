@@ -1,6 +1,7 @@
 import argparse
-import os
-from app import WeatherApp
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 
 def parse_arguments():
@@ -34,11 +35,39 @@ def parse_arguments():
     return parser.parse_args()
 
 
+def setup_logging():
+    """Route log records through a queue, so writing them never blocks the polling loop"""
+    from config import LOG_LEVEL
+
+    log_queue = queue.SimpleQueue()
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s | %(message)s")
+    )
+    listener = QueueListener(log_queue, handler)
+
+    root = logging.getLogger()
+    root.setLevel(LOG_LEVEL)
+    root.addHandler(QueueHandler(log_queue))
+    listener.start()
+    return listener
+
+
 def main():
     args = parse_arguments()
 
-    # Create and run the weather app
-    app = WeatherApp(args.cities, args.sources)
+    # imported only once arguments are parsed, so --help does not pay for loading
+    # the providers, their HTTP session and the .env file
+    from app import WeatherApp
+
+    listener = setup_logging()
+
+    try:
+        # Create and run the weather app
+        app = WeatherApp(args.cities, args.sources)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
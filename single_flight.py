@@ -0,0 +1,44 @@
+import threading
+from concurrent.futures import Future
+from functools import partial, wraps
+
+"""
+# single-flight calls
+    concurrent callers asking for the same key share one in-flight call
+    instead of each issuing their own upstream request
+"""
+
+
+def single_flight(func=None, *, key=None):
+    """Coalesce concurrent calls of func(arg) that map to the same key into one"""
+    if func is None:
+        return partial(single_flight, key=key)
+
+    inflight = {}
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper(arg):
+        flight_key = key(arg) if key else arg
+        with lock:
+            future = inflight.get(flight_key)
+            leader = future is None
+            if leader:
+                future = inflight[flight_key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func(arg)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with lock:
+                del inflight[flight_key]
+
+    return wrapper
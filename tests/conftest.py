@@ -0,0 +1,57 @@
+import pytest
+import requests
+
+import http_session
+import weather_data_api
+
+
+@pytest.fixture(autouse=True)
+def session(monkeypatch):
+    """Give every test its own in-memory session instead of the on-disk cache"""
+    session = http_session.create_session(backend="memory")
+    monkeypatch.setattr(http_session, "_session", session)
+    return session
+
+
+@pytest.fixture
+def fake_session(monkeypatch, session):
+    """Serve a fixed JSON payload from a provider's session and record the requested urls"""
+    providers = []
+
+    def install(provider, payload: dict, status_code: int = 200):
+        urls = []
+
+        class MockResponse:
+            def raise_for_status(self):
+                if status_code >= 400:
+                    raise requests.HTTPError(f"{status_code} Error")
+
+            def json(self):
+                return payload
+
+        def mock_get(url):
+            urls.append(url)
+            return MockResponse()
+
+        provider._get_one.cache_clear()
+        providers.append(provider)
+        monkeypatch.setattr(session, "get", mock_get)
+        return urls
+
+    yield install
+
+    # don't let responses cached from the fake session leak into other tests
+    for provider in providers:
+        provider._get_one.cache_clear()
+
+
+@pytest.fixture
+def csv_db(tmp_path, monkeypatch):
+    """Point the CSV source at a temporary file with the given content"""
+
+    def write(content: str):
+        path = tmp_path / "weather_data.csv"
+        path.write_text(content, encoding="utf-8")
+        monkeypatch.setattr(weather_data_api, "DB_PATH", str(path))
+
+    return write
@@ -0,0 +1,103 @@
+import pytest
+import app as app_module
+from app import WeatherApp
+
+
+def make_app(sources=(1, 2, 3)):
+    """Build a WeatherApp without starting its lifecycle"""
+    app = WeatherApp.__new__(WeatherApp)
+    app.cities = ["Berlin"]
+    app.sources = list(sources)
+    app._consec_failures = 0
+    return app
+
+
+class TestWeatherAppConfig:
+
+    @pytest.fixture
+    def settings(self, monkeypatch):
+        for name in [
+            "POLLING_INTERVAL",
+            "LOGZ_TOKEN",
+            "LOGZ_HOST",
+            "WEATHER_API_KEY",
+            "OPENWEATHERMAP_API_KEY",
+        ]:
+            monkeypatch.setenv(name, "value")
+        return monkeypatch
+
+    def test_check_config_complete(self, settings):
+        """Test startup passes when every required setting is present"""
+        make_app().check_config()
+
+    @pytest.mark.parametrize("name", ["LOGZ_TOKEN", "LOGZ_HOST", "WEATHER_API_KEY"])
+    def test_check_config_missing_setting(self, settings, name):
+        """Test startup fails naming the missing setting"""
+        settings.delenv(name)
+
+        with pytest.raises(RuntimeError, match=name):
+            make_app().check_config()
+
+    def test_check_config_ignores_unused_sources(self, settings):
+        """Test API keys are only required for the selected sources"""
+        settings.delenv("WEATHER_API_KEY")
+        settings.delenv("OPENWEATHERMAP_API_KEY")
+
+        make_app(sources=[3]).check_config()
+
+
+class TestWeatherAppBackoff:
+
+    @pytest.fixture(autouse=True)
+    def no_jitter(self, monkeypatch):
+        monkeypatch.setattr(app_module.random, "uniform", lambda low, high: 0)
+
+    def test_delay_doubles_with_consecutive_failures(self):
+        """Test every consecutive failed cycle doubles the wait"""
+        app = make_app()
+
+        delays = [app._next_delay(10, 2, failed=True) for _ in range(3)]
+
+        assert delays == [20, 40, 80]
+
+    def test_delay_is_capped(self):
+        """Test the backoff never exceeds MAX_BACKOFF plus jitter"""
+        app = make_app()
+
+        for _ in range(10):
+            delay = app._next_delay(10, 2, failed=True)
+
+        assert delay == WeatherApp.MAX_BACKOFF
+
+    def test_success_resets_backoff(self):
+        """Test a successful cycle returns to the regular cadence"""
+        app = make_app()
+        for _ in range(3):
+            app._next_delay(10, 2, failed=True)
+
+        assert app._next_delay(10, 2, failed=False) == 8
+        assert app._next_delay(10, 2, failed=True) == 20
+
+    def test_jitter_is_added_to_the_delay(self, monkeypatch):
+        """Test up to one interval of random jitter is added"""
+        monkeypatch.setattr(app_module.random, "uniform", lambda low, high: high)
+
+        assert make_app()._next_delay(10, 2, failed=True) == 30
+
+    def test_transient_error_fails_cycle(self):
+        """Test a transient provider error triggers backoff"""
+        polled_data = {
+            "source_1_result": {"error": "503 Server Error", "transient": True},
+            "source_3_result": [{"city": "Berlin"}],
+        }
+
+        assert WeatherApp._cycle_failed(polled_data)
+
+    def test_permanent_error_does_not_fail_cycle(self):
+        """Test an unknown city or revoked key does not slow down polling"""
+        polled_data = {
+            "source_1_result": {"error": "400 Client Error", "transient": False},
+            "source_3_result": [{"city": "Berlin"}],
+        }
+
+        assert not WeatherApp._cycle_failed(polled_data)
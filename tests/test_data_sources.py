@@ -0,0 +1,61 @@
+import data_sources
+from data_sources import WeatherDataSources
+
+
+class TestWeatherDataSources:
+
+    def test_get_weather_provider_failure_is_isolated(self, monkeypatch):
+        """Test a failing provider does not discard results from the others"""
+
+        def failing_get_weather(cities):
+            raise ConnectionError("provider unavailable")
+
+        monkeypatch.setitem(data_sources._PROVIDERS, 1, failing_get_weather)
+
+        result = WeatherDataSources.get_weather(["Berlin"], [1, 3])
+
+        assert result["source_1_result"] == {
+            "error": "provider unavailable",
+            "transient": False,
+        }
+        assert result["source_3_result"][0]["city"] == "Berlin"
+
+    def test_get_weather_invalid_sources(self):
+        """Test invalid sources are reported back in the warning"""
+        result = WeatherDataSources.get_weather(["Berlin"], [3, 4, 7])
+
+        assert result == {"warning": "invalid data sources were provided: [4, 7]"}
+
+    def test_get_weather_duplicate_sources(self, monkeypatch):
+        """Test a repeated source only queries its provider once"""
+        calls = []
+
+        def counting_get_weather(cities):
+            calls.append(cities)
+            return []
+
+        monkeypatch.setitem(data_sources._PROVIDERS, 3, counting_get_weather)
+
+        result = WeatherDataSources.get_weather(["Berlin"], [3, 3])
+
+        assert result == {"source_3_result": []}
+        assert len(calls) == 1
+
+    def test_get_weather_keeps_city_spelling(self, csv_db):
+        """Test exact spellings still match, and case and spacing are ignored"""
+        csv_db(
+            "city,temperature,description\n"
+            "Rio de Janeiro,27.0,Sunny\n"
+            "St. John's,4.5,Fog\n"
+            "Berlin,18.5,Scattered clouds\n"
+        )
+
+        result = WeatherDataSources.get_weather(
+            ["Rio de Janeiro", "St. John's", "  berlin "], [3]
+        )
+
+        assert [city["city"] for city in result["source_3_result"]] == [
+            "Rio de Janeiro",
+            "St. John's",
+            "Berlin",
+        ]
@@ -0,0 +1,122 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+from requests_cache import EXPIRE_IMMEDIATELY
+
+from http_session import _retry, city_key, create_session, is_transient
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serves a fixed body, answering 304 when the client already has it"""
+
+    ETAG = '"v1"'
+    validators = []
+
+    def do_GET(self):
+        ETagHandler.validators.append(self.headers.get("If-None-Match"))
+
+        if self.headers.get("If-None-Match") == self.ETAG:
+            self.send_response(304)
+            self.send_header("ETag", self.ETAG)
+            self.end_headers()
+            return
+
+        body = b'{"name": "Berlin"}'
+        self.send_response(200)
+        self.send_header("ETag", self.ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def etag_server():
+    ETagHandler.validators = []
+    server = HTTPServer(("127.0.0.1", 0), ETagHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+
+
+class TestConditionalRequests:
+
+    def test_expired_response_is_revalidated(self, etag_server):
+        """Test an expired response is refreshed with If-None-Match and reused on 304"""
+        session = create_session(backend="memory", expire_after=EXPIRE_IMMEDIATELY)
+
+        first = session.get(etag_server)
+        second = session.get(etag_server)
+
+        assert ETagHandler.validators == [None, '"v1"']
+        assert second.from_cache
+        assert second.json() == first.json() == {"name": "Berlin"}
+
+    def test_api_keys_are_not_cached(self, etag_server):
+        """Test provider API keys are redacted from cached responses"""
+        session = create_session(backend="memory")
+
+        session.get(f"{etag_server}?q=Berlin&key=secret&appid=secret")
+        cached = next(iter(session.cache.responses.values()))
+
+        assert "secret" not in cached.url
+        assert "secret" not in cached.request.url
+
+
+class TestRetryPolicy:
+
+    @pytest.mark.parametrize("method", ["GET", "POST"])
+    def test_transient_statuses_are_retried(self, method):
+        """Test provider GETs and Logz POSTs are both retried on 429/5xx"""
+        assert _retry.is_retry(method, 429)
+        assert _retry.is_retry(method, 503)
+        assert not _retry.is_retry(method, 404)
+
+
+def http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(f"{status_code} Error", response=response)
+
+
+class TestIsTransient:
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            http_error(429),
+            http_error(503),
+            requests.ConnectionError("connection refused"),
+            requests.Timeout("read timed out"),
+            requests.exceptions.RetryError("max retries exceeded"),
+        ],
+    )
+    def test_transient_errors(self, error):
+        """Test rate limiting, server errors and network failures are transient"""
+        assert is_transient(error)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            http_error(400),
+            http_error(401),
+            KeyError("current"),
+            requests.exceptions.MissingSchema("no scheme"),
+        ],
+    )
+    def test_permanent_errors(self, error):
+        """Test client errors and malformed responses are not transient"""
+        assert not is_transient(error)
+
+
+class TestCityKey:
+
+    def test_city_key_ignores_case_and_spacing(self):
+        """Test case and whitespace variations share one key"""
+        assert city_key("  rio   de JANEIRO ") == city_key("Rio de Janeiro")
+        assert city_key("St. John's") == city_key("st. john's")
+        assert city_key("McAllen") != city_key("Mc Allen")
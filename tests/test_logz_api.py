@@ -0,0 +1,105 @@
+import logging
+import threading
+
+import pytest
+import requests
+
+from logz_api import LogzAPI, LogzClient
+
+
+def logz_response(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return response
+
+
+class TestLogzClientBatching:
+
+    def test_close_flushes_pending_logs(self, monkeypatch):
+        """Test queued entries are posted together when the client closes"""
+        batches = []
+        monkeypatch.setattr(
+            LogzAPI, "post_logs", lambda entries: batches.append(entries)
+        )
+
+        client = LogzClient(batch_size=10, flush_interval=60)
+        client.post_log({"message": "first"})
+        client.post_log({"message": "second"})
+        client.close()
+
+        assert batches == [[{"message": "first"}, {"message": "second"}]]
+
+    def test_full_batch_is_posted_immediately(self, monkeypatch):
+        """Test a batch is sent as soon as it reaches the size threshold"""
+        batches = []
+        monkeypatch.setattr(
+            LogzAPI, "post_logs", lambda entries: batches.append(entries)
+        )
+
+        client = LogzClient(batch_size=2, flush_interval=60)
+        for i in range(3):
+            client.post_log({"message": i})
+        client.close()
+
+        assert batches == [[{"message": 0}, {"message": 1}], [{"message": 2}]]
+
+    def test_full_queue_drops_new_entries(self, monkeypatch):
+        """Test entries are dropped instead of blocking when the queue is full"""
+        batches = []
+        posting, release = threading.Event(), threading.Event()
+
+        def slow_post_logs(entries):
+            posting.set()
+            release.wait()
+            batches.append(entries)
+
+        monkeypatch.setattr(LogzAPI, "post_logs", slow_post_logs)
+
+        client = LogzClient(batch_size=1, flush_interval=60, max_pending=1)
+        client.post_log({"message": 0})
+        posting.wait()
+        client.post_log({"message": 1})
+        client.post_log({"message": 2})  # queue is full - dropped
+        release.set()
+        client.close()
+
+        assert batches == [[{"message": 0}], [{"message": 1}]]
+
+
+class TestLogzAPIPayload:
+
+    def test_post_logs_sends_newline_delimited_json(self, monkeypatch, session):
+        """Test each entry is serialized as its own JSON line"""
+        payloads = []
+
+        def mock_post(url, data, headers):
+            payloads.append(data)
+            return logz_response(200)
+
+        monkeypatch.setattr(session, "post", mock_post)
+
+        LogzAPI.post_logs([{"message": "first"}, {"message": "second"}])
+
+        assert payloads == [b'{"message":"first"}\n{"message":"second"}']
+
+    def test_post_logs_raises_on_rejected_batch(self, monkeypatch, session):
+        """Test an error status from Logz raises instead of passing silently"""
+        monkeypatch.setattr(
+            session, "post", lambda url, data, headers: logz_response(401)
+        )
+
+        with pytest.raises(requests.HTTPError):
+            LogzAPI.post_logs([{"message": "first"}])
+
+    def test_rejected_batch_is_logged(self, monkeypatch, session, caplog):
+        """Test the client logs a batch that Logz rejected"""
+        monkeypatch.setattr(
+            session, "post", lambda url, data, headers: logz_response(401)
+        )
+
+        client = LogzClient(batch_size=10, flush_interval=60)
+        client.post_log({"message": "first"})
+        with caplog.at_level(logging.ERROR, logger="logz_api"):
+            client.close()
+
+        assert "Error posting logs to Logz" in caplog.text
@@ -0,0 +1,86 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+import single_flight as single_flight_module
+from single_flight import single_flight
+
+
+class TestSingleFlight:
+
+    def test_concurrent_calls_share_one_result(self, monkeypatch):
+        """Test concurrent calls for the same key only run the function once"""
+        calls = []
+        release = threading.Event()
+        waiting = threading.Semaphore(0)
+
+        class TrackedFuture(Future):
+            # only followers wait on the shared future - the leader computes it
+            def result(self, timeout=None):
+                waiting.release()
+                return super().result(timeout)
+
+        monkeypatch.setattr(single_flight_module, "Future", TrackedFuture)
+
+        @single_flight
+        def fetch(city):
+            calls.append(city)
+            release.wait()
+            return {"city": city}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(fetch, "Berlin") for _ in range(4)]
+            # hold the leader until the other three callers share its call
+            for _ in range(3):
+                assert waiting.acquire(timeout=5)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert calls == ["Berlin"]
+        assert results == [{"city": "Berlin"}] * 4
+
+    def test_failure_is_not_remembered(self):
+        """Test a failed call is retried by the next caller"""
+        attempts = []
+
+        @single_flight
+        def fetch(city):
+            attempts.append(city)
+            if len(attempts) == 1:
+                raise ConnectionError("provider unavailable")
+            return {"city": city}
+
+        with pytest.raises(ConnectionError):
+            fetch("Berlin")
+
+        assert fetch("Berlin") == {"city": "Berlin"}
+
+    def test_key_function_groups_calls(self, monkeypatch):
+        """Test calls sharing a key coalesce while func gets its own argument"""
+        calls = []
+        release = threading.Event()
+        waiting = threading.Semaphore(0)
+
+        class TrackedFuture(Future):
+            def result(self, timeout=None):
+                waiting.release()
+                return super().result(timeout)
+
+        monkeypatch.setattr(single_flight_module, "Future", TrackedFuture)
+
+        @single_flight(key=str.casefold)
+        def fetch(city):
+            calls.append(city)
+            release.wait()
+            return {"city": city}
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(fetch, "Berlin")
+            while not calls:
+                release.wait(0.001)
+            follower = executor.submit(fetch, "BERLIN")
+            assert waiting.acquire(timeout=5)
+            release.set()
+
+        assert calls == ["Berlin"]
+        assert leader.result() == follower.result() == {"city": "Berlin"}
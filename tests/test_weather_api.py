@@ -1,4 +1,6 @@
 import pytest
+import requests
+import weather_api
 from weather_api import WeatherAPI
 
 
@@ -42,5 +44,35 @@ class TestWeatherAPITransform:
             # Missing "current" key
         }
 
-        with pytest.raises(AttributeError):
+        with pytest.raises(KeyError):
             WeatherAPI.transform_response(mock_response)
+
+
+class TestWeatherAPICache:
+
+    def test_get_weather_reuses_cached_city(self, fake_session):
+        """Test repeated polls for the same city only hit the API once"""
+        calls = fake_session(
+            weather_api,
+            {
+                "location": {"name": "Berlin"},
+                "current": {"temp_c": 18.5, "condition": {"text": "Sunny"}},
+            },
+        )
+
+        first = WeatherAPI.get_weather(["Berlin"])
+        second = WeatherAPI.get_weather(["Berlin"])
+
+        assert first == second
+        assert len(calls) == 1
+
+    def test_get_weather_raises_http_errors(self, fake_session):
+        """Test error responses raise HTTPError instead of reaching the transform"""
+        fake_session(
+            weather_api,
+            {"error": {"code": 1006, "message": "No matching location found."}},
+            status_code=400,
+        )
+
+        with pytest.raises(requests.HTTPError):
+            WeatherAPI.get_weather(["Atlantis"])
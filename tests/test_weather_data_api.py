@@ -19,3 +19,22 @@ class TestWeatherDataAPITransform:
         result = WeatherDataAPI.get_weather(["NonexistentCity"])
 
         assert result == []
+
+    def test_get_weather_duplicate_cities(self):
+        """Test repeated cities are only returned once"""
+        result = WeatherDataAPI.get_weather(["Berlin", "Berlin", "Sydney"])
+
+        assert [city["city"] for city in result] == ["Berlin", "Sydney"]
+
+    def test_get_weather_skips_blank_and_short_rows(self, csv_db):
+        """Test blank lines and truncated rows don't break the other rows"""
+        csv_db(
+            "city,temperature,description\n"
+            "Berlin,18.5,Scattered clouds\n"
+            "\n"
+            "Sydney,22.1,Sunny\n"
+        )
+
+        result = WeatherDataAPI.get_weather(["Berlin", "Sydney"])
+
+        assert [city["city"] for city in result] == ["Berlin", "Sydney"]
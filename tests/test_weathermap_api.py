@@ -1,4 +1,5 @@
 import pytest
+import weathermap_api
 from weathermap_api import WeathermapAPI
 
 
@@ -26,3 +27,49 @@ class TestWeatherMapAPITransform:
 
         with pytest.raises(IndexError):
             WeathermapAPI.transform_response(mock_response)
+
+    def test_transform_response_malformed_data(self):
+        """Test transformation with malformed/missing data"""
+        mock_response = {
+            "name": "Sydney",
+            # Missing "main" key
+            "weather": [{"description": "Sunny"}],
+        }
+
+        with pytest.raises(KeyError):
+            WeathermapAPI.transform_response(mock_response)
+
+
+class TestWeatherMapAPIRequest:
+
+    def test_get_weather_encodes_city_name(self, fake_session):
+        """Test city names with spaces are URL encoded"""
+        urls = fake_session(
+            weathermap_api,
+            {
+                "name": "Tel Aviv",
+                "main": {"temp": 25.0},
+                "weather": [{"description": "Clear sky"}],
+            },
+        )
+
+        WeathermapAPI.get_weather(["Tel Aviv"])
+
+        assert "q=Tel+Aviv&" in urls[0]
+
+    def test_get_weather_keeps_city_spelling(self, fake_session):
+        """Test the provider gets the city as given, cached regardless of case"""
+        urls = fake_session(
+            weathermap_api,
+            {
+                "name": "Rio de Janeiro",
+                "main": {"temp": 27.0},
+                "weather": [{"description": "Sunny"}],
+            },
+        )
+
+        WeathermapAPI.get_weather(["Rio de Janeiro"])
+        WeathermapAPI.get_weather(["rio  de JANEIRO"])
+
+        assert len(urls) == 1
+        assert "q=Rio+de+Janeiro&" in urls[0]
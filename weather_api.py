@@ -1,38 +1,30 @@
-import requests
-import os
-
-# import dotenv
-
-# dotenv.load_dotenv()
+from config import WEATHER_API_KEY
+from http_session import city_fetcher, fetch_all
 
 
 class WeatherAPI:
 
     BASE_URL = "http://api.weatherapi.com/v1"
     WEATHER_ROUTE = "/current.json"
-
-    @staticmethod
-    def get_api_key():
-        return os.getenv("WEATHER_API_KEY")
+    URL_TEMPLATE = f"{BASE_URL}{WEATHER_ROUTE}?key={WEATHER_API_KEY}&q={{city}}"
 
     @staticmethod
     def transform_response(weather_data: dict):
-        city = weather_data.get("location").get("name")
-        temperature = weather_data.get("current").get("temp_c")
-        description = weather_data.get("current").get("condition").get("text")
+        # plain subscripts - no method calls, and a missing key fails with a KeyError
+        current = weather_data["current"]
+        city = weather_data["location"]["name"]
+        temperature = current["temp_c"]
+        description = current["condition"]["text"]
 
         return {"city": city, "temperature": temperature, "description": description}
 
     @staticmethod
     def get_weather(cities: [str]):
-        result = []
-        for city in cities:
-            url = f"{WeatherAPI.BASE_URL}{WeatherAPI.WEATHER_ROUTE}?key={WeatherAPI.get_api_key()}&q={city}"
-            response = requests.get(url)
-            data = WeatherAPI.transform_response(response.json())
-            result.append(data)
-
-        return result
+        return fetch_all(_get_one, cities)
+
+
+# cached, single-flight fetch of one city
+_get_one = city_fetcher(WeatherAPI.URL_TEMPLATE, WeatherAPI.transform_response)
 
 
 # print(WeatherAPI.get_weather("Tel Aviv"))
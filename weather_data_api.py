@@ -1,27 +1,48 @@
 import csv
 import json
+import os
+
+from cachetools import LRUCache, cached
+
+from http_session import city_key
+
+DB_PATH = "weather_data.csv"
 
 
 class WeatherDataAPI:
 
     @staticmethod
     def get_db():
-        with open("weather_data.csv", "r") as file:
-            csv_reader = csv.DictReader(file)
-            data = list(csv_reader)
-            return data
+        # the file is only re-parsed when it changes on disk
+        return WeatherDataAPI._load_db(DB_PATH, os.stat(DB_PATH).st_mtime)
+
+    @staticmethod
+    @cached(LRUCache(maxsize=1))
+    def _load_db(path: str, mtime: float):
+        with open(path, "r", newline="", encoding="utf-8") as file:
+            # plain csv.reader + zip with the header is ~2x faster than csv.DictReader
+            csv_reader = csv.reader(file)
+            header = next(csv_reader, None)
+            if header is None:
+                return {}
+
+            # index rows by city_key for constant time, case-insensitive lookups.
+            # csv.reader yields [] for blank lines, so rows too short to hold a
+            # city are skipped
+            city_column = header.index("city")
+            return {
+                city_key(row[city_column]): dict(zip(header, row))
+                for row in csv_reader
+                if len(row) > city_column
+            }
 
     @staticmethod
     def get_weather(cities: [str]):
         data = WeatherDataAPI.get_db()
 
-        result = []
-        for city_data in data:
-            for city in cities:
-                if city == city_data["city"]:
-                    result.append(city_data)
-
-        return result
+        # dict.fromkeys drops repeated cities while keeping the requested order
+        keys = dict.fromkeys(city_key(city) for city in cities)
+        return [data[key] for key in keys if key in data]
 
 
 # print(WeatherDataAPI.get_weather(["Berlin", "Sydney"]))
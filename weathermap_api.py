@@ -1,37 +1,28 @@
-import requests
-import os
-
-# import dotenv
-
-# dotenv.load_dotenv()
+from config import OPENWEATHERMAP_API_KEY
+from http_session import city_fetcher, fetch_all
 
 
 class WeathermapAPI:
 
     BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
-
-    @staticmethod
-    def get_api_key():
-        return os.getenv("OPENWEATHERMAP_API_KEY")
+    URL_TEMPLATE = f"{BASE_URL}?q={{city}}&appid={OPENWEATHERMAP_API_KEY}&units=metric"
 
     @staticmethod
     def transform_response(weather_data: dict):
-        city = weather_data.get("name")
-        temperature = weather_data.get("main").get("temp")
-        description = weather_data.get("weather")[0].get("description")
+        # plain subscripts - no method calls, and a missing key fails with a KeyError
+        city = weather_data["name"]
+        temperature = weather_data["main"]["temp"]
+        description = weather_data["weather"][0]["description"]
 
         return {"city": city, "temperature": temperature, "description": description}
 
     @staticmethod
     def get_weather(cities: [str]):
-        result = []
-        for city in cities:
-            url = f"{WeathermapAPI.BASE_URL}?q={city}&appid={WeathermapAPI.get_api_key()}&units=metric"
-            response = requests.get(url)
-            data = WeathermapAPI.transform_response(response.json())
-            result.append(data)
-
-        return result
+        return fetch_all(_get_one, cities)
+
+
+# cached, single-flight fetch of one city
+_get_one = city_fetcher(WeathermapAPI.URL_TEMPLATE, WeathermapAPI.transform_response)
 
 
 # print(WeathermapAPI.get_weather(["Tel Aviv", "New York"]))